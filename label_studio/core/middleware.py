@@ -198,6 +198,28 @@ class InactivitySessionTimeoutMiddleWare(CommonMiddleware):
     # paths that don't count as user activity
     NOT_USER_ACTIVITY_PATHS = []
 
+    @staticmethod
+    def get_session_timeout_policy(request, organization):
+        """Return (max_session_age, max_time_between_activity) in minutes for the organization.
+
+        The policy is kept in the session and re-read from the database only when the organization
+        switches or its session_policy_version changes, instead of querying it on every request.
+        """
+        cached = request.session.get('session_timeout_policy')
+        if cached and cached[:2] == [organization.id, organization.session_policy_version]:
+            return cached[2], cached[3]
+
+        # the version was loaded with the organization, before the policy row is read: a concurrent change
+        # stores a stale version with fresh values at worst, which is re-read on the next request
+        policy = organization.session_timeout_policy
+        request.session['session_timeout_policy'] = [
+            organization.id,
+            organization.session_policy_version,
+            policy.max_session_age,
+            policy.max_time_between_activity,
+        ]
+        return policy.max_session_age, policy.max_time_between_activity
+
     def process_request(self, request) -> None:
         if (
             not hasattr(request, 'session')
@@ -216,10 +238,9 @@ class InactivitySessionTimeoutMiddleWare(CommonMiddleware):
 
         active_org = request.user.active_organization
         if flag_set('fflag_feat_utc_46_session_timeout_policy', user=request.user) and active_org:
-            org_max_session_age = timedelta(minutes=active_org.session_timeout_policy.max_session_age).total_seconds()
-            max_time_between_activity = timedelta(
-                minutes=active_org.session_timeout_policy.max_time_between_activity
-            ).total_seconds()
+            max_session_age, max_time_between_activity = self.get_session_timeout_policy(request, active_org)
+            org_max_session_age = timedelta(minutes=max_session_age).total_seconds()
+            max_time_between_activity = timedelta(minutes=max_time_between_activity).total_seconds()
 
             if (current_time - last_login) > org_max_session_age:
                 logger.info(
@@ -519,6 +519,8 @@ os.makedirs(EXPORT_DIR, exist_ok=True)
 # dir for delayed export
 DELAYED_EXPORT_DIR = 'export'
 os.makedirs(os.path.join(BASE_DATA_DIR, MEDIA_ROOT, DELAYED_EXPORT_DIR), exist_ok=True)
+# decode JPEGs at half resolution for SEG_CSV intensity means (faster, approximate means)
+SEGMENTATION_EXPORT_JPEG_DRAFT = get_bool_env('SEGMENTATION_EXPORT_JPEG_DRAFT', False)
 
 # file / task size limits
 DATA_UPLOAD_MAX_MEMORY_SIZE = int(get_env('DATA_UPLOAD_MAX_MEMORY_SIZE', 250 * 1024 * 1024))
@@ -52,6 +52,7 @@ from label_studio_sdk._extensions.label_studio_tools.core.utils.exceptions impor
 from packaging.version import parse as parse_version
 from pyboxen import boxen
 from rest_framework import status
+from requests.adapters import HTTPAdapter
 from rest_framework.exceptions import APIException, ErrorDetail
 from rest_framework.views import Response, exception_handler
 
@@ -602,9 +603,13 @@ class temporary_disconnect_all_signals(object):
     def disconnect(self, signal):
         self.stashed_signals[signal] = signal.receivers
         signal.receivers = []
+        # model signals cache receivers per sender; without clearing it the stashed receivers keep firing
+        # and the deletion collector can't fall back to fast (signal-less) bulk deletes
+        signal.sender_receivers_cache.clear()
 
     def reconnect(self, signal):
         signal.receivers = self.stashed_signals.get(signal, [])
+        signal.sender_receivers_cache.clear()
         del self.stashed_signals[signal]
 
 
@@ -624,6 +629,34 @@ class DjangoFilterDescriptionInspector(CoreAPICompatInspector):
         return NotHandled
 
 
+class ProcessSession:
+    """Pooled requests.Session shared by the threads of one process
+
+    Sessions are keyed by pid (as in ml.api_connector): a forked worker builds its own instead of
+    reusing connections inherited from the parent. Keyword arguments go to HTTPAdapter.
+
+    Example:
+        _http = ProcessSession(pool_maxsize=32, max_retries=Retry(total=1))
+        _http.get().post(url, data=data)
+    """
+
+    def __init__(self, schemes=('http://', 'https://'), **adapter_kwargs):
+        self.schemes = schemes
+        self.adapter_kwargs = adapter_kwargs
+        self._sessions = {}
+
+    def get(self) -> requests.Session:
+        key = os.getpid()
+        session = self._sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(**self.adapter_kwargs)
+            for scheme in self.schemes:
+                session.mount(scheme, adapter)
+            session = self._sessions.setdefault(key, session)
+        return session
+
+
 def batch(iterable, n=1):
     l = len(iterable)  # noqa: E741
     for ndx in range(0, l, n):
@@ -6,23 +6,42 @@ both Brush (RLE mask) and Polygon regions.
 
 import csv
 import io
-import json
 import logging
 import os
-import shutil
+import threading
+import zipfile
 import base64
 from urllib.parse import urljoin
-from collections import defaultdict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
-import requests
+from core.utils.common import ProcessSession
 from django.conf import settings
 from PIL import Image, ImageDraw
+from urllib3.util.retry import Retry
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Same bound as the storage export workers (io_storages.base_models)
+EXPORT_MAX_WORKERS = min(8, (os.cpu_count() or 2) * 4)
+
+DOWNLOAD_TIMEOUT = (5, 30)  # (connect, read) seconds
+DOWNLOAD_POOL_SIZE = 32
+DOWNLOAD_RETRIES = Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+
+# Pooled session shared by the export threads
+_http = ProcessSession(
+    pool_connections=DOWNLOAD_POOL_SIZE, pool_maxsize=DOWNLOAD_POOL_SIZE, max_retries=DOWNLOAD_RETRIES
+)
+
 
 @dataclass
 class ImageSource:
@@ -31,6 +50,15 @@ class ImageSource:
     filename: str  # best-effort filename for reporting
 
 
+@dataclass
+class DecodedImage:
+    width: int  # full-resolution size, even if the arrays were decoded at reduced scale
+    height: int
+    rgb: Optional[np.ndarray]  # (H, W, 3) uint8, None for single-channel images
+    gray: Optional[np.ndarray]  # (H, W), only set for single-channel images
+    scale: int = 1  # arrays hold every `scale`-th pixel (JPEG draft decoding)
+
+
 CSV_COLUMNS = [
     "image_filename",
     "task_id",
@@ -51,31 +79,63 @@ CSV_COLUMNS = [
 ]
 
 
-def _decode_brush_rle_to_mask(rle: List[int], width: int, height: int) -> np.ndarray:
+# Above this many runs the NumPy decode is dominated by its temporaries, use the native loop
+NUMBA_RLE_MIN_RUNS = 4096
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _fill_rle_runs(runs, out):
+        n = out.size
+        idx = 0
+        value = 0
+        for count in runs:
+            if count <= 0:
+                value ^= 1
+                continue
+            end = min(idx + count, n)
+            if value:
+                out[idx:end] = 1
+            idx = end
+            value ^= 1
+            if idx >= n:
+                return
+
+else:
+    _fill_rle_runs = None
+
+
+def _decode_brush_rle_to_mask(rle: Union[List[int], np.ndarray], width: int, height: int) -> np.ndarray:
     """Decode Label Studio brush RLE to a boolean mask of shape (height, width).
 
     RLE is a list of run-lengths alternating 0s and 1s, starting with 0s.
     Example: [0, 1, 1, 2, 3] -> 0, 1, 0,0, 1,1, 0,0,0
+
+    Every entry toggles the current value, so the i-th run is a run of ones iff i is odd;
+    non-positive counts toggle without advancing. Runs of ones are expanded by flipping a
+    toggle bit at their start and end and taking a cumulative XOR over the buffer.
     """
     total = width * height
-    flat = np.zeros(total, dtype=np.uint8)
-    value = 0  # start from zeros
-    idx = 0
-    for count in rle:
-        if count <= 0:
-            value = 1 - value
-            continue
-        end = min(idx + count, total)
-        if value == 1:
-            flat[idx:end] = 1
-        idx = end
-        value = 1 - value
-        if idx >= total:
-            break
-    if idx < total:
-        # remaining assumed zeros (already 0)
-        pass
-    return flat.reshape((height, width)) > 0
+    runs = np.asarray(rle, dtype=np.int64).ravel()
+    if _fill_rle_runs is not None and runs.size > NUMBA_RLE_MIN_RUNS:
+        out = np.zeros(total, dtype=np.uint8)
+        _fill_rle_runs(runs, out)
+        return out.view(bool).reshape((height, width))
+
+    counts = np.clip(runs, 0, None)
+    ends = np.cumsum(counts).clip(max=total)
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1]
+    ones = (counts > 0) & (np.arange(runs.size) % 2 == 1)
+
+    # one extra slot so that runs ending at `total` have somewhere to toggle
+    flat = np.zeros(total + 1, dtype=np.uint8)
+    # adjacent runs may share a boundary, so the toggles must accumulate rather than overwrite
+    np.bitwise_xor.at(flat, starts[ones], 1)
+    np.bitwise_xor.at(flat, ends[ones], 1)
+    np.bitwise_xor.accumulate(flat, out=flat)
+    return flat[:total].view(bool).reshape((height, width))
 
 
 def _polygon_points_percent_to_px(points: List[List[float]], width: int, height: int) -> List[Tuple[float, float]]:
@@ -87,50 +147,108 @@ def _polygon_points_percent_to_px(points: List[List[float]], width: int, height:
     return px_points
 
 
-def _rasterize_polygon(points_px: List[Tuple[float, float]], width: int, height: int) -> np.ndarray:
+def _points_to_json(points_px: List[Tuple[float, float]]) -> str:
+    """Serialize pixel points as a JSON array of [x, y] pairs, "" if there are none.
+
+    Hand-rolled since the points are always numeric pairs; 3 decimals is plenty for pixels.
+    """
     if not points_px:
-        return np.zeros((height, width), dtype=bool)
-    img = Image.new("L", (width, height), 0)
-    draw = ImageDraw.Draw(img)
+        return ""
+    return "[" + ",".join("[%.3f,%.3f]" % (x, y) for x, y in points_px) + "]"
+
+
+def _rasterize_polygon(points_px: List[Tuple[float, float]], width: int, height: int) -> Tuple[int, int, np.ndarray]:
+    """Rasterize a polygon into a mask covering only its bounding box on the canvas.
+
+    Returns (x0, y0, mask) where mask[0, 0] is canvas pixel (x0, y0).
+    """
+    if not points_px:
+        return 0, 0, np.zeros((0, 0), dtype=bool)
     # Cast to ints for robust rasterization
-    draw.polygon([(int(round(x)), int(round(y))) for x, y in points_px], outline=1, fill=1)
-    return np.array(img, dtype=np.uint8) > 0
+    points = [(int(round(x)), int(round(y))) for x, y in points_px]
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    x0, x1 = max(0, min(xs)), min(width - 1, max(xs))
+    y0, y1 = max(0, min(ys)), min(height - 1, max(ys))
+    if x1 < x0 or y1 < y0:
+        return 0, 0, np.zeros((0, 0), dtype=bool)
+    # Only the polygon's rows are drawn. Columns are cropped afterwards rather than by
+    # shifting the polygon: PIL's span rounding is not exactly invariant to x translation.
+    # A 1-bit canvas converts straight to a bool array, no uint8 copy plus "> 0" pass.
+    img = Image.new("1", (width, y1 - y0 + 1), 0)
+    draw = ImageDraw.Draw(img)
+    draw.polygon([(x, y - y0) for x, y in points], outline=1, fill=1)
+    return x0, y0, np.asarray(img)[:, x0 : x1 + 1]
 
 
 def _compute_bbox_and_area(mask: np.ndarray) -> Tuple[int, int, int, int, int]:
     """Return bbox_x, bbox_y, width, height, area (all ints)."""
-    ys, xs = np.where(mask)
-    if xs.size == 0 or ys.size == 0:
+    # Project onto each axis instead of materializing index arrays with np.where
+    rows = mask.any(axis=1)
+    if not rows.any():
         return 0, 0, 0, 0, 0
-    x_min = int(xs.min())
-    y_min = int(ys.min())
-    x_max = int(xs.max())
-    y_max = int(ys.max())
-    w = int(max(0, x_max - x_min))
-    h = int(max(0, y_max - y_min))
-    area = int(mask.sum())
-    return x_min, y_min, w, h, area
-
-
-def _compute_intensities(image: Image.Image, mask: np.ndarray) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
-    if mask.sum() == 0:
-        return None, None, None, None
+    cols = mask.any(axis=0)
+    y_min = int(np.argmax(rows))
+    y_max = int(rows.size - 1 - np.argmax(rows[::-1]))
+    x_min = int(np.argmax(cols))
+    x_max = int(cols.size - 1 - np.argmax(cols[::-1]))
+    area = int(np.count_nonzero(mask))
+    return x_min, y_min, x_max - x_min, y_max - y_min, area
+
+
+def _decode_image(image: Image.Image, draft: bool = False) -> DecodedImage:
+    """Extract the pixel arrays needed for intensity means, once per image.
+
+    With `draft`, JPEGs are decoded at half resolution using libjpeg's DCT scaling.
+    """
+    width, height = image.width, image.height
+    scale = 1
+    if draft and image.format == "JPEG" and width > 1 and height > 1:
+        image.draft("L" if image.mode == "L" else "RGB", (width // 2, height // 2))
+        # libjpeg scales by 1/2, 1/4 or 1/8, rounding sizes up
+        scale = next((s for s in (8, 4, 2) if -(-width // s) == image.width), 1)
     mode = image.mode
-    mask_bool = mask.astype(bool)
-    # Always compute gray
-    gray_np = np.array(image.convert("L"), dtype=np.float32)
-    mean_gray = float(gray_np[mask_bool].mean()) if mask_bool.any() else None
-    # Compute RGB only if image has color channels
     if mode in ("L", "I", "I;16", "F"):
+        gray = np.asarray(image if mode == "L" else image.convert("L"))
+        return DecodedImage(width=width, height=height, rgb=None, gray=gray, scale=scale)
+    # convert() always copies, even to the same mode
+    rgb = np.asarray(image if mode == "RGB" else image.convert("RGB"))
+    return DecodedImage(width=width, height=height, rgb=rgb, gray=None, scale=scale)
+
+
+# ITU-R BT.601 luma, the same weights as PIL's "L" conversion
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114])
+
+
+def _masked_pixels(arr: np.ndarray, mask: np.ndarray, x0: int, y0: int, scale: int) -> np.ndarray:
+    """Pixels of `arr` under a mask whose top-left pixel is (x0, y0) in full-resolution coordinates."""
+    if scale == 1:
+        return arr[y0 : y0 + mask.shape[0], x0 : x0 + mask.shape[1]][mask]
+    # Reduced-resolution array: every masked pixel takes the value of the pixel covering it
+    # (nearest), so the mean is still weighted by the full-resolution area
+    ys, xs = np.nonzero(mask)
+    return arr[(ys + y0) // scale, (xs + x0) // scale]
+
+
+def _compute_intensities(
+    image: DecodedImage, mask: np.ndarray, area: int, x0: int = 0, y0: int = 0
+) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+    """Mean gray/R/G/B over a boolean mask whose pixel count `area` is already known.
+
+    The mask may be a crop of the image whose top-left pixel is (x0, y0).
+    """
+    if area == 0:
+        return None, None, None, None
+    # Single-channel images: gray only, no RGB
+    if image.rgb is None:
+        gray = _masked_pixels(image.gray, mask, x0, y0, image.scale)
+        mean_gray = float(gray.sum(dtype=np.float64)) / area
         return mean_gray, None, None, None
-    img_rgb = image.convert("RGB")
-    r, g, b = img_rgb.split()
-    r_np = np.array(r, dtype=np.float32)
-    g_np = np.array(g, dtype=np.float32)
-    b_np = np.array(b, dtype=np.float32)
-    mean_r = float(r_np[mask_bool].mean()) if mask_bool.any() else None
-    mean_g = float(g_np[mask_bool].mean()) if mask_bool.any() else None
-    mean_b = float(b_np[mask_bool].mean()) if mask_bool.any() else None
+    # One reduction over the (N, 3) masked pixels yields all four means: the mean is linear,
+    # so gray is the luma-weighted channel sum and no gray image or (N, 4) buffer is built
+    sums = _masked_pixels(image.rgb, mask, x0, y0, image.scale).sum(axis=0, dtype=np.float64)
+    mean_r, mean_g, mean_b = (float(v) / area for v in sums)
+    mean_gray = float(sums @ LUMA_WEIGHTS) / area
     return mean_gray, mean_r, mean_g, mean_b
 
 
@@ -229,7 +347,7 @@ def _open_image(project, source: ImageSource, download_resources: bool) -> Optio
         pass
 
     try:
-        resp = requests.get(source.url, headers=headers, timeout=30)
+        resp = _http.get().get(source.url, headers=headers, timeout=DOWNLOAD_TIMEOUT)
         resp.raise_for_status()
         return Image.open(io.BytesIO(resp.content))
     except Exception as exc:
@@ -237,26 +355,70 @@ def _open_image(project, source: ImageSource, download_resources: bool) -> Optio
         return None
 
 
-def _get_object_value_key_for_result(project, result_to_name: str) -> Optional[str]:
-    """From parsed config find the object tag value key (e.g., "$image" -> "image") for the given to_name."""
+class _ImageCache:
+    """Small LRU of decoded images keyed by source URL.
+
+    Regions of the same image would otherwise download and decode it once per region
+    (plus once more for the size probe). Failed opens are cached too, as None.
+    """
+
+    def __init__(self, project, download_resources: bool, maxsize: int = 8, draft: bool = False):
+        self.project = project
+        self.download_resources = download_resources
+        self.maxsize = maxsize
+        self.draft = draft
+        self._items: "OrderedDict[str, Optional[DecodedImage]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: ImageSource) -> Optional[DecodedImage]:
+        key = source.url
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        # Decode outside the lock so other images load concurrently; two threads racing on
+        # the same URL just decode it twice
+        decoded = None
+        pil_img = _open_image(self.project, source, self.download_resources)
+        if pil_img is not None:
+            try:
+                decoded = _decode_image(pil_img, draft=self.draft)
+            except Exception as exc:
+                logger.debug(f"Failed to decode image {source.url}: {exc}")
+            finally:
+                pil_img.close()
+
+        with self._lock:
+            self._items[key] = decoded
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return decoded
+
+
+def _get_image_value_keys(project) -> Tuple[Dict[str, str], Optional[str]]:
+    """Map Image object names to their task data keys (e.g., "$image" -> "image").
+
+    Returns (value_key_by_name, default_value_key), where the default is the key of the
+    first Image object in the config and is used for results whose to_name is unknown.
+    """
     try:
         config = project.get_parsed_config()
     except Exception:
         config = {}
+    value_key_by_name: Dict[str, str] = {}
+    default_value_key: Optional[str] = None
     for control_name, control in (config or {}).items():
         for obj in control.get("inputs", []) or []:
-            if obj.get("type") == "Image" and obj.get("name") == result_to_name:
-                val = obj.get("value") or ""
-                if isinstance(val, str) and val.startswith("$"):
-                    return val[1:]
-                return val
-    # Fallback: find any image object
-    for control_name, control in (config or {}).items():
-        for obj in control.get("inputs", []) or []:
-            if obj.get("type") == "Image":
-                val = obj.get("value") or ""
-                return val[1:] if isinstance(val, str) and val.startswith("$") else val
-    return None
+            if obj.get("type") != "Image":
+                continue
+            val = obj.get("value") or ""
+            if isinstance(val, str) and val.startswith("$"):
+                val = val[1:]
+            value_key_by_name.setdefault(obj.get("name"), val)
+            if default_value_key is None:
+                default_value_key = val
+    return value_key_by_name, default_value_key
 
 
 def _first_label_from_result_value(value: Dict, key: str) -> str:
@@ -266,6 +428,181 @@ def _first_label_from_result_value(value: Dict, key: str) -> str:
     return str(labels)
 
 
+def _process_task(
+    task: Dict,
+    project,
+    download_resources: bool,
+    hostname: Optional[str],
+    image_cache: _ImageCache,
+    value_key_by_name: Dict[str, str],
+    default_value_key: Optional[str],
+) -> List[Tuple[str, tuple]]:
+    """Compute the CSV rows for one task as (image_key, row) pairs, rows ordered as CSV_COLUMNS."""
+    rows: List[Tuple[str, tuple]] = []
+    task_id = task.get("id")
+    data = task.get("data") or {}
+    annotations = task.get("annotations") or []
+    # Regions of a task point at a handful of objects; resolve each image source once
+    # (resolving may presign a storage URL) instead of per region
+    source_by_to_name: Dict[str, Optional[ImageSource]] = {}
+
+    for ann in annotations:
+        ann_id = ann.get("id")
+        results = ann.get("result") or []
+        # Pre-scan labels and textarea means by region id to merge shape+label cases and reuse intensities
+        label_by_region: Dict[str, str] = {}
+        textarea_by_region: Dict[str, float] = {}
+        for res in results:
+            value = res.get("value") or {}
+            region_id = res.get("id")
+            if region_id is None:
+                continue
+            lb = None
+            if value.get("brushlabels"):
+                lb = _first_label_from_result_value(value, "brushlabels")
+            elif value.get("polygonlabels"):
+                lb = _first_label_from_result_value(value, "polygonlabels")
+            if lb:
+                label_by_region[str(region_id)] = lb
+            # Reuse TextArea mean intensity if present
+            if res.get("type") == "textarea":
+                texts = value.get("text") or []
+                if isinstance(texts, list) and texts:
+                    try:
+                        textarea_by_region[str(region_id)] = float(str(texts[0]).strip())
+                    except Exception:
+                        pass
+
+        processed_region_ids: set[str] = set()
+        for res in results:
+            rtype = (res.get("type") or "").lower()
+            value = res.get("value") or {}
+
+            # Determine object/image URL early to allow size fallback
+            to_name = res.get("to_name") or ""
+            if to_name not in source_by_to_name:
+                data_key = value_key_by_name.get(to_name, default_value_key) or next(iter(data.keys()), None)
+                image_url = data.get(data_key) if data_key in data else next(iter(data.values()), None)
+                source_by_to_name[to_name] = (
+                    _resolve_image_source(project, str(image_url), download_resources, hostname) if image_url else None
+                )
+            source = source_by_to_name[to_name]
+            if source is None:
+                logger.debug("Skip region without image url")
+                continue
+
+            # Obtain original size, fallback to image probe if needed
+            ow = res.get("original_width") or value.get("original_width")
+            oh = res.get("original_height") or value.get("original_height")
+            original_width = int(ow) if ow else 0
+            original_height = int(oh) if oh else 0
+            if (not original_width or not original_height) and download_resources:
+                probe = image_cache.get(source)
+                if probe is not None:
+                    original_width, original_height = probe.width, probe.height
+            if not original_width or not original_height:
+                logger.debug("Skip region without original image size (no fallback available)")
+                continue
+
+            # Detect mask/polygon robustly
+            is_mask = (rtype == "brushlabels") or (value.get("format") == "rle" and isinstance(value.get("rle"), list))
+            is_polygon = (rtype == "polygonlabels") or (isinstance(value.get("points"), list) and value.get("points"))
+
+            region_id = res.get("id")
+            if region_id is None:
+                # Avoid duplicates but still handle anonymous regions uniquely per index
+                region_id = f"{rtype}-{id(res)}"
+            region_id_str = str(region_id)
+            if region_id_str in processed_region_ids:
+                continue
+
+            if is_mask:
+                rle = value.get("rle") or []
+                try:
+                    mask = _decode_brush_rle_to_mask(rle, original_width, original_height)
+                except Exception as exc:
+                    logger.debug(f"Failed to decode RLE: {exc}")
+                    continue
+                bbox_x, bbox_y, w, h, area = _compute_bbox_and_area(mask)
+                # Intensities only need the region's bounding box
+                mask_x, mask_y = bbox_x, bbox_y
+                mask = mask[bbox_y : bbox_y + h + 1, bbox_x : bbox_x + w + 1]
+                shape_type = "mask"
+                label = _first_label_from_result_value(value, "brushlabels") or label_by_region.get(region_id_str, "")
+                poly_points_px: List[Tuple[float, float]] = []
+            elif is_polygon:
+                points = value.get("points") or []
+                poly_points_px = _polygon_points_percent_to_px(points, original_width, original_height)
+                mask_x, mask_y, mask = _rasterize_polygon(poly_points_px, original_width, original_height)
+                bbox_x, bbox_y, w, h, area = _compute_bbox_and_area(mask)
+                if area:
+                    bbox_x += mask_x
+                    bbox_y += mask_y
+                shape_type = "polygon"
+                label = _first_label_from_result_value(value, "polygonlabels") or label_by_region.get(region_id_str, "")
+            else:
+                continue
+
+            # Prefer existing TextArea mean intensity if available for this region
+            tg = textarea_by_region.get(region_id_str)
+            if tg is not None:
+                mean_gray, mean_r, mean_g, mean_b = tg, None, None, None
+            else:
+                decoded = image_cache.get(source)
+                mean_gray = mean_r = mean_g = mean_b = None
+                if decoded is not None and (decoded.width, decoded.height) != (original_width, original_height):
+                    logger.debug(f"Image size of {source.url} does not match the annotated size, skip intensities")
+                elif decoded is not None:
+                    try:
+                        mean_gray, mean_r, mean_g, mean_b = _compute_intensities(decoded, mask, area, mask_x, mask_y)
+                    except Exception as exc:
+                        logger.debug(f"Failed to compute intensities for {source.url}: {exc}")
+
+            # Fields in CSV_COLUMNS order
+            row = (
+                source.filename,
+                task_id,
+                ann_id,
+                region_id,
+                label,
+                shape_type,
+                bbox_x,
+                bbox_y,
+                w,
+                h,
+                area,
+                mean_gray if mean_gray is not None else "",
+                mean_r if mean_r is not None else "",
+                mean_g if mean_g is not None else "",
+                mean_b if mean_b is not None else "",
+                _points_to_json(poly_points_px),
+            )
+
+            # Group per image (include task id to avoid collisions)
+            key = f"{source.filename}__task_{task_id}"
+            rows.append((key, row))
+            processed_region_ids.add(region_id_str)
+    return rows
+
+
+_FLAT_NAME_TRANS = str.maketrans({"/": "_", "\\": "_", ":": "_"})
+
+
+def _map_bounded(executor: ThreadPoolExecutor, fn, items: Iterable, window: int):
+    """Like executor.map(), but keeps at most `window` items in flight.
+
+    executor.map() submits the whole iterable up front, which would pull a streamed
+    task source (cursor, ijson) entirely into memory.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
 def export_segmentation_metrics(tasks: Iterable[Dict], project, download_resources: bool, hostname: Optional[str] = None):
     """Create a ZIP file with per-image CSVs and return (open_file, content_type, filename).
 
@@ -279,175 +616,49 @@ def export_segmentation_metrics(tasks: Iterable[Dict], project, download_resourc
     from core.utils.io import get_temp_dir, path_to_open_binary_file
 
     with get_temp_dir() as tmp_dir:
-        # Per-image rows accumulator
-        rows_by_image: Dict[str, List[Dict]] = defaultdict(list)
-
-        for task in tasks:
-            task_id = task.get("id")
-            data = task.get("data") or {}
-            annotations = task.get("annotations") or []
-
-            for ann in annotations:
-                ann_id = ann.get("id")
-                results = ann.get("result") or []
-                # Pre-scan labels and textarea means by region id to merge shape+label cases and reuse intensities
-                label_by_region: Dict[str, str] = {}
-                textarea_by_region: Dict[str, float] = {}
-                for res in results:
-                    value = res.get("value") or {}
-                    region_id = res.get("id")
-                    if region_id is None:
-                        continue
-                    lb = None
-                    if value.get("brushlabels"):
-                        lb = _first_label_from_result_value(value, "brushlabels")
-                    elif value.get("polygonlabels"):
-                        lb = _first_label_from_result_value(value, "polygonlabels")
-                    if lb:
-                        label_by_region[str(region_id)] = lb
-                    # Reuse TextArea mean intensity if present
-                    if res.get("type") == "textarea":
-                        texts = value.get("text") or []
-                        if isinstance(texts, list) and texts:
-                            try:
-                                textarea_by_region[str(region_id)] = float(str(texts[0]).strip())
-                            except Exception:
-                                pass
-
-                processed_region_ids: set[str] = set()
-                for res in results:
-                    rtype = (res.get("type") or "").lower()
-                    value = res.get("value") or {}
-
-                    # Determine object/image URL early to allow size fallback
-                    to_name = res.get("to_name") or ""
-                    data_key = _get_object_value_key_for_result(project, to_name) or next(iter(data.keys()), None)
-                    image_url = data.get(data_key) if data_key in data else next(iter(data.values()), None)
-                    if not image_url:
-                        logger.debug("Skip region without image url")
-                        continue
-                    source = _resolve_image_source(project, str(image_url), download_resources, hostname)
-
-                    # Obtain original size, fallback to image probe if needed
-                    ow = res.get("original_width") or value.get("original_width")
-                    oh = res.get("original_height") or value.get("original_height")
-                    original_width = int(ow) if ow else 0
-                    original_height = int(oh) if oh else 0
-                    if (not original_width or not original_height) and download_resources:
-                        probe = _open_image(project, source, download_resources)
-                        if probe is not None:
-                            try:
-                                original_width, original_height = int(probe.width), int(probe.height)
-                            finally:
-                                try:
-                                    probe.close()
-                                except Exception:
-                                    pass
-                    if not original_width or not original_height:
-                        logger.debug("Skip region without original image size (no fallback available)")
-                        continue
-
-                    # Detect mask/polygon robustly
-                    is_mask = (rtype == "brushlabels") or (value.get("format") == "rle" and isinstance(value.get("rle"), list))
-                    is_polygon = (rtype == "polygonlabels") or (isinstance(value.get("points"), list) and value.get("points"))
-
-                    region_id = res.get("id")
-                    if region_id is None:
-                        # Avoid duplicates but still handle anonymous regions uniquely per index
-                        region_id = f"{rtype}-{id(res)}"
-                    region_id_str = str(region_id)
-                    if region_id_str in processed_region_ids:
-                        continue
-
-                    if is_mask:
-                        rle = value.get("rle") or []
-                        try:
-                            mask = _decode_brush_rle_to_mask(list(rle), original_width, original_height)
-                        except Exception as exc:
-                            logger.debug(f"Failed to decode RLE: {exc}")
-                            continue
-                        shape_type = "mask"
-                        label = _first_label_from_result_value(value, "brushlabels") or label_by_region.get(region_id_str, "")
-                        poly_points_px: List[Tuple[float, float]] = []
-                    elif is_polygon:
-                        points = value.get("points") or []
-                        poly_points_px = _polygon_points_percent_to_px(points, original_width, original_height)
-                        mask = _rasterize_polygon(poly_points_px, original_width, original_height)
-                        shape_type = "polygon"
-                        label = _first_label_from_result_value(value, "polygonlabels") or label_by_region.get(region_id_str, "")
-                    else:
-                        continue
-
-                    bbox_x, bbox_y, w, h, area = _compute_bbox_and_area(mask)
-
-                    # Prefer existing TextArea mean intensity if available for this region
-                    tg = textarea_by_region.get(region_id_str)
-                    if tg is not None:
-                        mean_gray, mean_r, mean_g, mean_b = tg, None, None, None
-                    else:
-                        pil_img = _open_image(project, source, download_resources)
-                        mean_gray = mean_r = mean_g = mean_b = None
-                        if pil_img is not None:
-                            try:
-                                mean_gray, mean_r, mean_g, mean_b = _compute_intensities(pil_img, mask)
-                            except Exception as exc:
-                                logger.debug(f"Failed to compute intensities for {source.url}: {exc}")
-
-                    row = {
-                        "image_filename": source.filename,
-                        "task_id": task_id,
-                        "annotation_id": ann_id,
-                        "region_id": region_id,
-                        "label": label,
-                        "shape_type": shape_type,
-                        "bbox_x_px": bbox_x,
-                        "bbox_y_px": bbox_y,
-                        "x_length_px": w,
-                        "y_length_px": h,
-                        "area_px": area,
-                        "mean_gray": mean_gray if mean_gray is not None else "",
-                        "mean_r": mean_r if mean_r is not None else "",
-                        "mean_g": mean_g if mean_g is not None else "",
-                        "mean_b": mean_b if mean_b is not None else "",
-                        "polygon_points_px": json.dumps(poly_points_px) if poly_points_px else "",
-                    }
-
-                    # Group per image (include task id to avoid collisions)
-                    key = f"{source.filename}__task_{task_id}"
-                    rows_by_image[key].append(row)
-                    processed_region_ids.add(region_id_str)
-
-        # Write CSVs
-        for key, rows in rows_by_image.items():
-            # sanitize filename
-            safe_name = key.replace("/", "_").replace("\\", "_")
-            if not safe_name.lower().endswith(".csv"):
-                safe_name = f"{safe_name}.csv"
-            csv_path = os.path.join(tmp_dir, safe_name)
-            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-            with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-                writer.writeheader()
-                for r in rows:
-                    writer.writerow(r)
-
-        # If no rows produced, include a README to clarify
-        produced_any = any(rows_by_image.values())
-        if not produced_any:
-            readme_path = os.path.join(tmp_dir, "README.txt")
-            with open(readme_path, "w", encoding="utf-8") as rf:
-                rf.write(
-                    "No segmentation rows were generated. Ensure annotations include Brush (RLE) or Polygon regions, and that original image dimensions are present."
+        image_cache = _ImageCache(project, download_resources, draft=settings.SEGMENTATION_EXPORT_JPEG_DRAFT)
+        value_key_by_name, default_value_key = _get_image_value_keys(project)
+        produced_any = False
+
+        # CSVs are written straight into the archive, there are no intermediate files
+        zip_path = os.path.join(tmp_dir, "segmentation.zip")
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+            # Tasks are independent and dominated by image fetch/decode, so overlap them;
+            # results come back in task order
+            with ThreadPoolExecutor(max_workers=EXPORT_MAX_WORKERS) as executor:
+                for task_rows in _map_bounded(
+                    executor,
+                    lambda task: _process_task(
+                        task, project, download_resources, hostname, image_cache, value_key_by_name, default_value_key
+                    ),
+                    tasks,
+                    window=EXPORT_MAX_WORKERS * 2,
+                ):
+                    # Keys embed the task id, so a task's CSVs are complete once its rows are
+                    # known; write them right away instead of holding rows for the whole export.
+                    # ZipFile allows one open member at a time, hence the grouping.
+                    rows_by_image: Dict[str, List[tuple]] = {}
+                    for key, row in task_rows:
+                        rows_by_image.setdefault(key, []).append(row)
+                    for key, rows in rows_by_image.items():
+                        # Flat member names: no directories inside the archive
+                        safe_name = key.translate(_FLAT_NAME_TRANS)
+                        if not safe_name.lower().endswith(".csv"):
+                            safe_name = f"{safe_name}.csv"
+                        with zf.open(safe_name, "w", force_zip64=True) as member:
+                            with io.TextIOWrapper(member, encoding="utf-8", newline="") as f:
+                                writer = csv.writer(f)
+                                writer.writerow(CSV_COLUMNS)
+                                writer.writerows(rows)
+                        produced_any = True
+
+            # If no rows produced, include a README to clarify
+            if not produced_any:
+                zf.writestr(
+                    "README.txt",
+                    "No segmentation rows were generated. Ensure annotations include Brush (RLE) or Polygon regions, and that original image dimensions are present.",
                 )
 
-        # Package to ZIP and return file handle
-        archive_base = os.path.join(tmp_dir)
-        shutil.make_archive(archive_base, "zip", tmp_dir)
-        zip_path = archive_base + ".zip"
-        from core.utils.io import path_to_open_binary_file
-
-        out = path_to_open_binary_file(os.path.abspath(zip_path))
+        out = path_to_open_binary_file(zip_path)
         filename = f"project-{project.id}-segmentation.csv.zip"
         return out, "application/zip", filename
-
-
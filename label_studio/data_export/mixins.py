@@ -1,17 +1,16 @@
 import hashlib
-import io
 import json
 import logging
+import operator
 import pathlib
 import shutil
 from datetime import datetime
 from functools import reduce
 
 import django_rq
+from core.bulk_update_utils import grouper
 from core.redis import redis_connected
-from core.utils.common import batch
 from core.utils.io import (
-    SerializableGenerator,
     get_all_dirs_from_dir,
     get_all_files_from_dir,
     get_temp_dir,
@@ -20,13 +19,19 @@ from data_manager.models import View
 from django.conf import settings
 from django.core.files import File
 from django.core.files import temp as tempfile
+from django.core.files.uploadedfile import TemporaryUploadedFile
 from django.db import transaction
-from django.db.models import Prefetch
+from django.db.models import Exists, OuterRef, Prefetch
 from django.db.models.query_utils import Q
 from django.utils import dateformat, timezone
 from label_studio_sdk.converter import Converter
 from tasks.models import Annotation, AnnotationDraft, Task
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ONLY = 'only'
 EXCLUDE = 'exclude'
 
@@ -34,6 +39,27 @@ EXCLUDE = 'exclude'
 logger = logging.getLogger(__name__)
 
 
+def _encode_export_item(item):
+    """Encode one exported task to UTF-8 JSON bytes, with orjson when it's installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which only the stdlib encoder handles
+            pass
+    return json.dumps(item, ensure_ascii=False).encode('utf-8')
+
+
+def iter_export_json(items):
+    """Stream a JSON array of items as bytes chunks, one encoded item at a time"""
+    yield b'['
+    for i, item in enumerate(items):
+        if i:
+            yield b','
+        yield _encode_export_item(item)
+    yield b']'
+
+
 class ExportMixin:
     def has_permission(self, user):
         user.project = self.project  # link for activity log
@@ -42,13 +68,14 @@ class ExportMixin:
     def get_default_title(self):
         return f"{self.project.title.replace(' ', '-')}-at-{dateformat.format(timezone.now(), 'Y-m-d-H-i')}"
 
-    def _get_filtered_tasks(self, tasks, task_filter_options=None):
+    def _get_filtered_tasks(self, tasks, task_filter_options=None, annotation_filter_options=None):
         """
         task_filter_options: None or Dict({
             view: optional int id or View
             skipped: optional None or str:("include|exclude")
             finished: optional None or str:("include|exclude")
             annotated: optional None or str:("include|exclude")
+            only_with_annotations: optional bool
         })
         """
         if not isinstance(task_filter_options, dict):
@@ -82,6 +109,11 @@ class ExportMixin:
                 tasks = tasks.filter(annotations__was_cancelled=False)
             elif value == EXCLUDE:
                 tasks = tasks.exclude(annotations__was_cancelled=False)
+        if task_filter_options.get('only_with_annotations'):
+            # keep tasks with at least one annotation that passes the annotation filter, i.e. gets exported
+            # correlated on task_id, so only the annotations of the candidate tasks are looked at
+            annotations = self._get_filtered_annotations_queryset(annotation_filter_options=annotation_filter_options)
+            tasks = tasks.filter(Exists(annotations.filter(task=OuterRef('pk'))))
 
         return tasks
 
@@ -105,7 +137,7 @@ class ExportMixin:
             if annotation_filter_options.get('skipped'):
                 q_list.append(Q(was_cancelled=True))
             if q_list:
-                q = reduce(lambda x, y: x | y, q_list)
+                q = q_list[0] if len(q_list) == 1 else reduce(operator.or_, q_list)
                 queryset = queryset.filter(q)
 
         # pre-select completed_by user info
@@ -197,24 +229,23 @@ class ExportMixin:
             self.counters = {'task_number': 0}
             all_tasks = self.project.tasks
             logger.debug('Tasks filtration')
-            task_ids = (
-                self._get_filtered_tasks(all_tasks, task_filter_options=task_filter_options)
-                .distinct()
-                .values_list('id', flat=True)
-            )
+            BATCH_SIZE = 1000
+            # filtered ids go in as a subquery and tasks are streamed from one cursor,
+            # Django runs the prefetches for every chunk of BATCH_SIZE tasks
+            filtered_ids = self._get_filtered_tasks(
+                all_tasks, task_filter_options=task_filter_options, annotation_filter_options=annotation_filter_options
+            ).values('id')
+            task_queryset = self.get_task_queryset(filtered_ids, annotation_filter_options)
             base_export_serializer_option = self._get_export_serializer_option(serialization_options)
             i = 0
-            BATCH_SIZE = 1000
-            for ids in batch(task_ids, BATCH_SIZE):
+            for tasks in grouper(task_queryset.iterator(chunk_size=BATCH_SIZE), BATCH_SIZE):
                 i += 1
-                tasks = list(self.get_task_queryset(ids, annotation_filter_options))
                 logger.debug(f'Batch: {i*BATCH_SIZE}')
-                if isinstance(task_filter_options, dict) and task_filter_options.get('only_with_annotations'):
-                    tasks = [task for task in tasks if task.annotations.exists()]
 
                 if serialization_options and serialization_options.get('include_annotation_history') is True:
-                    task_ids = [task.id for task in tasks]
-                    annotation_ids = Annotation.objects.filter(task_id__in=task_ids).values_list('id', flat=True)
+                    annotation_ids = Annotation.objects.filter(task_id__in=[task.id for task in tasks]).values_list(
+                        'id', flat=True
+                    )
                     base_export_serializer_option = self.update_export_serializer_option(
                         base_export_serializer_option, annotation_ids
                     )
@@ -229,6 +260,10 @@ class ExportMixin:
         )
 
     def update_export_serializer_option(self, base_export_serializer_option, annotation_ids):
+        """
+        annotation_ids: lazy values_list queryset of the batch's annotation ids, nothing is fetched
+        unless it's evaluated; filter with it (id__in=annotation_ids) to keep it a SQL subquery
+        """
         return base_export_serializer_option
 
     @staticmethod
@@ -246,7 +281,8 @@ class ExportMixin:
         now = datetime.now()
         file_name = f'project-{self.project.id}-at-{now.strftime("%Y-%m-%d-%H-%M")}-{md5[0:8]}.json'
         file_path = f'{self.project.id}/{file_name}'  # finally file will be in settings.DELAYED_EXPORT_DIR/self.project.id/file_name
-        file_ = File(file, name=file_path)
+        # keep File subclasses as they are: wrapping would hide temporary_file_path() from the storage
+        file_ = file if isinstance(file, File) else File(file, name=file_path)
         self.file.save(file_path, file_)
         self.md5 = md5
         self.save(update_fields=['file', 'md5', 'counters'])
@@ -259,23 +295,25 @@ class ExportMixin:
             f'serialization_options: {serialization_options}\n'
         )
         try:
-            iter_json = json.JSONEncoder(ensure_ascii=False).iterencode(
-                SerializableGenerator(
-                    self.get_export_data(
-                        task_filter_options=task_filter_options,
-                        annotation_filter_options=annotation_filter_options,
-                        serialization_options=serialization_options,
-                    )
+            iter_json = iter_export_json(
+                self.get_export_data(
+                    task_filter_options=task_filter_options,
+                    annotation_filter_options=annotation_filter_options,
+                    serialization_options=serialization_options,
                 )
             )
-            with tempfile.NamedTemporaryFile(suffix='.export.json', dir=settings.FILE_UPLOAD_TEMP_DIR) as file:
-                for chunk in iter_json:
-                    encoded_chunk = chunk.encode('utf-8')
+            # hash while writing instead of reading the whole file back with eval_md5
+            md5_object = hashlib.md5()   # nosec
+            # TemporaryUploadedFile exposes temporary_file_path(), so FileSystemStorage moves it into place
+            # instead of copying it, remote storages stream it as before
+            with TemporaryUploadedFile('export.json', 'application/json', 0, None) as file:
+                for encoded_chunk in iter_json:
                     file.write(encoded_chunk)
+                    md5_object.update(encoded_chunk)
+                file.size = file.tell()
                 file.seek(0)
 
-                md5 = self.eval_md5(file)
-                self.save_file(file, md5)
+                self.save_file(file, md5_object.hexdigest())
 
             self.status = self.Status.COMPLETED
             self.save(update_fields=['status'])
@@ -315,25 +353,33 @@ class ExportMixin:
             )
 
     def convert_file(self, to_format, download_resources=False, hostname=None):
+        from projects.models import Project
+
+        # organization -> created_by -> auth_token in one query instead of three lazy lookups
+        project = Project.objects.select_related('organization__created_by__auth_token').get(pk=self.project_id)
+
+        if str(to_format).upper() == 'SEG_CSV':
+            return self._convert_to_segmentation_csv(project, download_resources, hostname)
+
         with get_temp_dir() as tmp_dir:
             OUT = 'out'
             out_dir = pathlib.Path(tmp_dir) / OUT
             out_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
 
             converter = Converter(
-                config=self.project.get_parsed_config(),
+                config=project.get_parsed_config(),
                 project_dir=None,
                 upload_dir=out_dir,
                 download_resources=download_resources,
                 # for downloading resource we need access to the API
-                access_token=self.project.organization.created_by.auth_token.key,
+                access_token=project.organization.created_by.auth_token.key,
                 hostname=hostname,
             )
             input_name = pathlib.Path(self.file.name).name
             input_file_path = pathlib.Path(tmp_dir) / input_name
 
-            with open(input_file_path, 'wb') as file_:
-                file_.write(self.file.open().read())
+            with self.file.open('rb') as src, open(input_file_path, 'wb') as file_:
+                shutil.copyfileobj(src, file_, length=1024 * 1024)
 
             converter.convert(input_file_path, out_dir, to_format, is_dir=False)
 
@@ -350,12 +396,24 @@ class ExportMixin:
                 output_file = pathlib.Path(tmp_dir) / (str(out_dir.stem) + '.zip')
                 filename = pathlib.Path(input_name).stem + '.zip'
 
-            # TODO(jo): can we avoid the `f.read()` here?
+            # tmp_dir is removed on exit, so stream the result to a temporary file that outlives it
+            # (deleted when closed) instead of holding the whole archive in memory
+            result = tempfile.NamedTemporaryFile(suffix=pathlib.Path(filename).suffix, dir=settings.FILE_UPLOAD_TEMP_DIR)
             with open(output_file, mode='rb') as f:
-                return File(
-                    io.BytesIO(f.read()),
-                    name=filename,
-                )
+                shutil.copyfileobj(f, result)
+            result.seek(0)
+            return File(result, name=filename)
+
+    def _convert_to_segmentation_csv(self, project, download_resources, hostname):
+        """SEG_CSV isn't a converter format: feed the snapshot tasks to the segmentation exporter,
+        parsed one by one with ijson rather than loading the whole JSON array"""
+        import ijson
+        from data_export.formats.segmentation_csv_exporter import export_segmentation_metrics
+
+        with self.file.open('rb') as snapshot:
+            tasks = ijson.items(snapshot, 'item', use_float=True)
+            out, _, filename = export_segmentation_metrics(tasks, project, download_resources, hostname)
+        return File(out, name=filename)
 
 
 def export_background(
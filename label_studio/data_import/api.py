@@ -362,7 +362,7 @@ class ImportAPI(generics.CreateAPIView):
             'data_columns': data_columns,
         }
         if tasks and return_task_ids:
-            response['task_ids'] = [task.id for task in tasks]
+            response['task_ids'] = serializer.db_task_ids
 
         return Response(response, status=status.HTTP_201_CREATED)
 
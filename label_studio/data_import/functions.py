@@ -18,22 +18,28 @@ from .uploader import load_tasks_for_async_import
 logger = logging.getLogger(__name__)
 
 
+def _start_processing(model, object_id):
+    """Move an import from CREATED to IN_PROGRESS with one conditional UPDATE, no SELECT + row lock.
+    Returns False if it doesn't exist or another worker has already started it"""
+    updated = model.objects.filter(id=object_id, status=model.Status.CREATED).update(status=model.Status.IN_PROGRESS)
+    if updated:
+        return True
+    if model.objects.filter(id=object_id).exists():
+        logger.error(f'Processing {model.__name__} with id {object_id} already started')
+    else:
+        logger.error(f'{model.__name__} with id {object_id} not found, import processing failed')
+    return False
+
+
 def async_import_background(
     import_id, user_id, recalculate_stats_func: Optional[Callable[..., None]] = None, **kwargs
 ):
-    with transaction.atomic():
-        try:
-            project_import = ProjectImport.objects.get(id=import_id)
-        except ProjectImport.DoesNotExist:
-            logger.error(f'ProjectImport with id {import_id} not found, import processing failed')
-            return
-        if project_import.status != ProjectImport.Status.CREATED:
-            logger.error(f'Processing import with id {import_id} already started')
-            return
-        project_import.status = ProjectImport.Status.IN_PROGRESS
-        project_import.save(update_fields=['status'])
-
-    user = User.objects.get(id=user_id)
+    if not _start_processing(ProjectImport, import_id):
+        return
+    # the import reads project.organization (serializer) and user.active_organization (webhooks)
+    project_import = ProjectImport.objects.select_related('project__organization').get(id=import_id)
+
+    user = User.objects.select_related('active_organization').get(id=user_id)
 
     start = time.time()
     project = project_import.project
@@ -46,6 +52,7 @@ def async_import_background(
         # turn flat task JSONs {"column1": value, "column2": value} into {"data": {"column1"..}, "predictions": [{..."column2"}]
         tasks = reformat_predictions(tasks, project_import.preannotated_from_fields)
 
+    task_ids = []
     if project_import.commit_to_project:
         with transaction.atomic():
             # Lock summary for update to avoid race conditions
@@ -55,7 +62,7 @@ def async_import_background(
             serializer = ImportApiSerializer(data=tasks, many=True, context={'project': project})
             serializer.is_valid(raise_exception=True)
             tasks = serializer.save(project_id=project.id)
-            emit_webhooks_for_instance(user.active_organization, project, WebhookAction.TASKS_CREATED, tasks)
+            task_ids = serializer.db_task_ids
 
             task_count = len(tasks)
             annotation_count = len(serializer.db_annotations)
@@ -80,6 +87,9 @@ def async_import_background(
 
             summary.update_data_columns(tasks)
             # TODO: summary.update_created_annotations_and_labels
+
+        # after commit: webhook delivery must not hold the summary lock, and receivers must see the new tasks
+        emit_webhooks_for_instance(user.active_organization, project, WebhookAction.TASKS_CREATED, tasks)
     else:
         # Do nothing - just output file upload ids for further use
         task_count = len(tasks)
@@ -96,7 +106,7 @@ def async_import_background(
     project_import.found_formats = found_formats
     project_import.data_columns = data_columns
     if project_import.return_task_ids:
-        project_import.task_ids = [task.id for task in tasks]
+        project_import.task_ids = task_ids
 
     project_import.status = ProjectImport.Status.COMPLETED
     project_import.save()
@@ -119,13 +129,12 @@ def set_reimport_background_failure(job, connection, type, value, _):
 
 
 def reformat_predictions(tasks, preannotated_from_fields):
-    new_tasks = []
-    for task in tasks:
-        if 'data' in task:
-            task = task['data']
-        predictions = [{'result': task.pop(field)} for field in preannotated_from_fields]
-        new_tasks.append({'data': task, 'predictions': predictions})
-    return new_tasks
+    """Move preannotated fields of each task into its predictions, rewriting the tasks list in place"""
+    fields = tuple(preannotated_from_fields)
+    for i, task in enumerate(tasks):
+        data = task.get('data', task)
+        tasks[i] = {'data': data, 'predictions': [{'result': data.pop(field)} for field in fields]}
+    return tasks
 
 
 post_process_reimport = load_func(settings.POST_PROCESS_REIMPORT)
@@ -133,17 +142,9 @@ post_process_reimport = load_func(settings.POST_PROCESS_REIMPORT)
 
 def async_reimport_background(reimport_id, organization_id, user, **kwargs):
 
-    with transaction.atomic():
-        try:
-            reimport = ProjectReimport.objects.get(id=reimport_id)
-        except ProjectReimport.DoesNotExist:
-            logger.error(f'ProjectReimport with id {reimport_id} not found, import processing failed')
-            return
-        if reimport.status != ProjectReimport.Status.CREATED:
-            logger.error(f'Processing reimport with id {reimport_id} already started')
-            return
-        reimport.status = ProjectReimport.Status.IN_PROGRESS
-        reimport.save(update_fields=['status'])
+    if not _start_processing(ProjectReimport, reimport_id):
+        return
+    reimport = ProjectReimport.objects.select_related('project__organization').get(id=reimport_id)
 
     project = reimport.project
 
@@ -159,7 +160,6 @@ def async_reimport_background(reimport_id, organization_id, user, **kwargs):
         serializer = ImportApiSerializer(data=tasks, many=True, context={'project': project, 'user': user})
         serializer.is_valid(raise_exception=True)
         tasks = serializer.save(project_id=project.id)
-        emit_webhooks_for_instance(organization_id, project, WebhookAction.TASKS_CREATED, tasks)
 
         task_count = len(tasks)
         annotation_count = len(serializer.db_annotations)
@@ -185,6 +185,9 @@ def async_reimport_background(reimport_id, organization_id, user, **kwargs):
         summary.update_data_columns(tasks)
         # TODO: summary.update_created_annotations_and_labels
 
+    # after commit, see async_import_background
+    emit_webhooks_for_instance(organization_id, project, WebhookAction.TASKS_CREATED, tasks)
+
     reimport.task_count = task_count
     reimport.annotation_count = annotation_count
     reimport.prediction_count = prediction_count
@@ -27,8 +27,14 @@ def create_organization(title, created_by, legacy_api_tokens_enabled=True, **kwa
 
 
 def destroy_organization(org):
+    from jwt_auth.models import JWTSettings
+    from session_policy.models import SessionTimeoutPolicy
+
     with temporary_disconnect_all_signals():
         Project.objects.filter(organization=org).delete()
         if hasattr(org, 'saml'):
             org.saml.delete()
+        # on_delete=DO_NOTHING one-to-ones: the cascade leaves them behind
+        JWTSettings.objects.filter(organization=org).delete()
+        SessionTimeoutPolicy.objects.filter(organization=org).delete()
         org.delete()
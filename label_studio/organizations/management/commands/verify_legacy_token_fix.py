@@ -0,0 +1,124 @@
+"""Verify that ML backend authentication keeps working: new organizations must be created with
+legacy API tokens enabled by default, and existing organizations are reported (or fixed with --fix).
+
+    python label_studio/manage.py verify_legacy_token_fix [--fix]
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+from jwt_auth.models import JWTSettings
+from organizations.functions import create_organization
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Verify that new organizations get legacy API tokens enabled, and report existing organizations'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix', action='store_true', help='Enable legacy tokens for existing organizations that have them disabled'
+        )
+
+    def handle(self, *args, **options):
+        success = self.verify_new_org_defaults()
+        self.check_existing_orgs(fix=options['fix'])
+        if not success:
+            raise CommandError('New organizations are created with legacy API tokens disabled')
+
+    def _create_and_check_org(self):
+        """Create a test user and organization and check the persisted JWT settings."""
+        self.stdout.write('\n1. Creating test user...')
+        test_user = User.objects.create(email='verify_test@example.com', username='verify_test')
+        self.stdout.write(self.style.SUCCESS(f'   ✓ Created user: {test_user.email}'))
+
+        self.stdout.write('\n2. Creating organization...')
+        org = create_organization(title='Verification Test Organization', created_by=test_user)
+        self.stdout.write(self.style.SUCCESS(f'   ✓ Created organization: {org.title} (ID: {org.id})'))
+
+        self.stdout.write('\n3. Checking JWT settings...')
+        # read just the two flags from the database (the org instance caches what create_organization set in memory)
+        flags = (
+            JWTSettings.objects.filter(organization_id=org.id)
+            .values_list('api_tokens_enabled', 'legacy_api_tokens_enabled')
+            .first()
+        )
+        if flags is None:
+            # no row yet: org.jwt (AutoOneToOneField) would create it with the model defaults
+            self.stdout.write('   No JWT settings saved yet, model defaults apply')
+            flags = tuple(
+                JWTSettings._meta.get_field(name).default
+                for name in ('api_tokens_enabled', 'legacy_api_tokens_enabled')
+            )
+        api_enabled, legacy_enabled = flags
+
+        self.stdout.write(f'   Organization ID: {org.id}')
+        self.stdout.write(f'   api_tokens_enabled: {api_enabled}')
+        self.stdout.write(f'   legacy_api_tokens_enabled: {legacy_enabled}')
+
+        if not legacy_enabled:
+            self.stdout.write(self.style.ERROR('\n   ✗ FAILED: legacy_api_tokens_enabled is False!'))
+            return False
+        self.stdout.write(self.style.SUCCESS('\n   ✓ PASSED: legacy_api_tokens_enabled is True!'))
+        return True
+
+    def verify_new_org_defaults(self):
+        """Verify that new organizations get legacy tokens enabled by default."""
+        self.stdout.write('=' * 60)
+        self.stdout.write('ML Backend Authentication Fix Verification')
+        self.stdout.write('=' * 60)
+
+        # Everything runs in a savepoint that is rolled back, so no test data is left behind
+        with transaction.atomic():
+            sid = transaction.savepoint()
+            try:
+                success = self._create_and_check_org()
+            finally:
+                self.stdout.write('\n4. Rolling back test data...')
+                transaction.savepoint_rollback(sid)
+                self.stdout.write(self.style.SUCCESS('   ✓ Test data rolled back'))
+
+        self.stdout.write('\n' + '=' * 60)
+        if success:
+            self.stdout.write(self.style.SUCCESS('✓ VERIFICATION PASSED'))
+            self.stdout.write('\nNew organizations will have legacy tokens enabled by default.')
+            self.stdout.write('ML backends will work without manual configuration.')
+        else:
+            self.stdout.write(self.style.ERROR('✗ VERIFICATION FAILED'))
+            self.stdout.write('\nThe fix was not applied correctly.')
+            self.stdout.write('Check label_studio/organizations/functions.py')
+        self.stdout.write('=' * 60)
+
+        return success
+
+    def check_existing_orgs(self, fix=False):
+        """Check how many existing organizations have legacy tokens disabled, and enable them with fix=True."""
+        self.stdout.write('\n' + '=' * 60)
+        self.stdout.write('Existing Organizations Status')
+        self.stdout.write('=' * 60)
+
+        stats = JWTSettings.objects.aggregate(
+            total=Count('pk'),
+            enabled=Count('pk', filter=Q(legacy_api_tokens_enabled=True)),
+        )
+        total, enabled = stats['total'], stats['enabled']
+        disabled = total - enabled
+
+        self.stdout.write(f'\nTotal organizations: {total}')
+        self.stdout.write(f'  With legacy tokens enabled: {enabled}')
+        self.stdout.write(f'  With legacy tokens disabled: {disabled}')
+
+        if disabled > 0 and fix:
+            # only rewrite the misconfigured rows
+            updated = JWTSettings.objects.filter(legacy_api_tokens_enabled=False).update(
+                legacy_api_tokens_enabled=True
+            )
+            self.stdout.write(self.style.SUCCESS(f'\n✓ Enabled legacy tokens for {updated} organization(s).'))
+        elif disabled > 0:
+            self.stdout.write(self.style.WARNING(f'\n⚠️  {disabled} organization(s) have legacy tokens disabled.'))
+            self.stdout.write('   ML backends will not work for these organizations.')
+            self.stdout.write('\n   To fix all existing organizations, run:')
+            self.stdout.write('   python3 manage.py verify_legacy_token_fix --fix')
+        else:
+            self.stdout.write(self.style.SUCCESS('\n✓ All organizations have legacy tokens enabled!'))
+
+        self.stdout.write('=' * 60)
@@ -2,7 +2,8 @@
 """
 import logging
 
-from organizations.models import Organization, OrganizationMember
+from organizations.models import Organization
+from users.models import User
 
 logger = logging.getLogger(__name__)
 
@@ -14,25 +15,21 @@ class DummyGetSessionMiddleware:
     def __call__(self, request):
         user = request.user
         if user and user.is_authenticated:
-            if user.active_organization is None:
+            # compare ids: reading user.active_organization would fetch the organization on every request
+            if user.active_organization_id is None:
                 # Create individual organization for user without one (legacy users)
                 org = Organization.create_organization(created_by=user, title=f"{user.email}'s Organization")
-                user.active_organization = org
-                user.save(update_fields=['active_organization'])
-            elif user.active_organization_id == 1:
-                # Check if user should be migrated out of organization 1
-                member = OrganizationMember.objects.filter(user=user, organization_id=1).first()
-                org1 = Organization.objects.get(id=1)
-                if member and not member.joined_via_invitation and org1.created_by != user:
-                    # User is in org 1 but didn't create it and wasn't invited - give them their own org
-                    org = Organization.create_organization(created_by=user, title=f"{user.email}'s Organization")
+                # plain UPDATE: no save signals, and no write if the user got an organization meanwhile
+                if User.objects.filter(pk=user.pk, active_organization__isnull=True).update(active_organization=org):
                     user.active_organization = org
-                    user.save(update_fields=['active_organization'])
-                    # Remove from organization 1
-                    member.delete()
-        
-        if user and user.is_authenticated and user.active_organization:
-            request.session['organization_pk'] = user.active_organization.id
-        
+                else:
+                    # another request assigned an organization first: use the one that won
+                    user.refresh_from_db(fields=['active_organization'])
+
+        if user and user.is_authenticated and user.active_organization_id:
+            # assigning marks the session modified, which saves it on every response even if nothing changed
+            if request.session.get('organization_pk') != user.active_organization_id:
+                request.session['organization_pk'] = user.active_organization_id
+
         response = self.get_response(request)
         return response
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0007_add_joined_via_invitation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="session_policy_version",
+            field=models.PositiveIntegerField(
+                db_default=0,
+                default=0,
+                help_text="Bumped on every session timeout policy change to invalidate policies cached in sessions",
+                null=True,
+                verbose_name="session policy version",
+            ),
+        ),
+    ]
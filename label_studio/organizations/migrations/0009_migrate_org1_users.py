@@ -0,0 +1,67 @@
+from django.db import migrations
+from django.db.models import F
+
+
+def forwards(apps, schema_editor):
+    """Give legacy users of organization 1, who neither created it nor were invited, their own organization.
+
+    Users who already created an organization are moved to that one instead (created_by is one-to-one).
+    Mirrors organizations.functions.create_organization with the historical models.
+    """
+    Organization = apps.get_model('organizations', 'Organization')
+    OrganizationMember = apps.get_model('organizations', 'OrganizationMember')
+    User = apps.get_model('users', 'User')
+    JWTSettings = apps.get_model('jwt_auth', 'JWTSettings')
+
+    members = (
+        OrganizationMember.objects.filter(
+            organization_id=1, joined_via_invitation=False, user__active_organization_id=1
+        )
+        .exclude(user_id=F('organization__created_by_id'))
+        .select_related('user')
+    )
+    owned = {
+        org.created_by_id: org
+        for org in Organization.objects.filter(created_by_id__in=members.values('user_id')).exclude(id=1)
+    }
+    already_members = set(
+        OrganizationMember.objects.filter(organization__in=owned.values()).values_list('user_id', 'organization_id')
+    )
+
+    users, member_ids = {}, []
+    new_members, jwt_settings = [], []
+    for member in members:
+        member_ids.append(member.id)
+        user = member.user
+        if user.id in users:
+            continue
+        org = owned.get(user.id)
+        if org is None:
+            org = Organization.objects.create(title=f"{user.email}'s Organization", created_by=user)
+            # legacy tokens stay on for ML backend compatibility; api_tokens_enabled only takes
+            # effect while the JWT feature flag is on, which the migration doesn't consult
+            jwt_settings.append(
+                JWTSettings(organization=org, api_tokens_enabled=True, legacy_api_tokens_enabled=True)
+            )
+        if (user.id, org.id) not in already_members:
+            new_members.append(OrganizationMember(user=user, organization=org))
+        user.active_organization = org
+        users[user.id] = user
+
+    OrganizationMember.objects.filter(id__in=member_ids).delete()
+    OrganizationMember.objects.bulk_create(new_members, batch_size=1000)
+    JWTSettings.objects.bulk_create(jwt_settings, batch_size=1000)
+    User.objects.bulk_update(users.values(), ['active_organization'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0008_organization_session_policy_version'),
+        ('users', '0010_userproducttour'),
+        ('jwt_auth', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -105,6 +105,14 @@ class Organization(OrganizationMixin, models.Model):
 
     contact_info = models.EmailField(_('contact info'), blank=True, null=True)
 
+    session_policy_version = models.PositiveIntegerField(
+        _('session policy version'),
+        default=0,
+        db_default=0,
+        null=True,
+        help_text='Bumped on every session timeout policy change to invalidate policies cached in sessions',
+    )
+
     def __str__(self):
         return self.title + ', id=' + str(self.pk)
 
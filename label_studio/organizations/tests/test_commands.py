@@ -0,0 +1,39 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from jwt_auth.models import JWTSettings
+from organizations.models import Organization
+from organizations.tests.factories import OrganizationFactory
+from users.models import User
+
+from label_studio.tests.utils import mock_feature_flag
+
+
+@pytest.mark.django_db
+@mock_feature_flag(flag_name='fflag__feature_develop__prompts__dia_1829_jwt_token_auth', value=True)
+def test_verify_legacy_token_fix_leaves_no_data():
+    organizations = Organization.objects.count()
+
+    out = StringIO()
+    call_command('verify_legacy_token_fix', stdout=out)
+
+    assert 'VERIFICATION PASSED' in out.getvalue()
+    assert Organization.objects.count() == organizations
+    assert not User.objects.filter(email='verify_test@example.com').exists()
+
+
+@pytest.mark.django_db
+def test_verify_legacy_token_fix_enables_disabled_orgs():
+    jwt = OrganizationFactory().jwt
+    jwt.legacy_api_tokens_enabled = False
+    jwt.save()
+
+    out = StringIO()
+    call_command('verify_legacy_token_fix', fix=True, stdout=out)
+
+    assert 'Enabled legacy tokens for 1 organization(s).' in out.getvalue()
+
+    jwt.refresh_from_db()
+    assert jwt.legacy_api_tokens_enabled
+    assert not JWTSettings.objects.filter(legacy_api_tokens_enabled=False).exists()
@@ -0,0 +1,44 @@
+from unittest import mock
+
+import pytest
+from django.db.models.signals import post_delete
+from jwt_auth.models import JWTSettings
+from organizations.functions import destroy_organization
+from organizations.models import Organization, OrganizationMember
+from organizations.tests.factories import OrganizationFactory
+from projects.models import Project
+from projects.tests.factories import ProjectFactory
+from tasks.models import Annotation, Task
+from tasks.tests.factories import AnnotationFactory, TaskFactory
+
+
+@pytest.mark.django_db
+def test_destroy_organization_removes_projects_without_signals():
+    org = OrganizationFactory()
+    JWTSettings.objects.get_or_create(organization=org)
+    other_project = ProjectFactory()
+    projects = ProjectFactory.create_batch(2, organization=org, created_by=org.created_by)
+    for project in projects:
+        task = TaskFactory(project=project)
+        AnnotationFactory(task=task, project=project)
+    receiver = mock.Mock()
+    post_delete.connect(receiver, sender=Task, weak=False)
+    try:
+        # deleting a task warms the receivers cache, the disconnect has to clear it
+        TaskFactory(project=other_project).delete()
+        receiver.reset_mock()
+
+        destroy_organization(org)
+
+        receiver.assert_not_called()
+    finally:
+        post_delete.disconnect(receiver, sender=Task)
+
+    project_ids = [project.id for project in projects]
+    assert not Organization.objects.filter(id=org.id).exists()
+    assert not OrganizationMember.objects.filter(organization_id=org.id).exists()
+    assert not JWTSettings.objects.filter(organization_id=org.id).exists()
+    assert not Project.objects.filter(id__in=project_ids).exists()
+    assert not Task.objects.filter(project_id__in=project_ids).exists()
+    assert not Annotation.objects.filter(project_id__in=project_ids).exists()
+    assert Project.objects.filter(id=other_project.id).exists()
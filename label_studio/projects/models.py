@@ -2,6 +2,7 @@
 """
 import json
 import logging
+from collections import Counter
 from typing import Any, Mapping, Optional
 
 from annoying.fields import AutoOneToOneField
@@ -1254,21 +1255,21 @@ class ProjectSummary(models.Model):
 
     def update_data_columns(self, tasks):
         common_data_columns = set()
-        all_data_columns = dict(self.all_data_columns)
+        all_data_columns = Counter(self.all_data_columns)
         for task in tasks:
             try:
                 task_data = get_attr_or_item(task, 'data')
             except KeyError:
                 task_data = task
             task_data_keys = task_data.keys()
-            for column in task_data_keys:
-                all_data_columns[column] = all_data_columns.get(column, 0) + 1
+            # Counter.update counts in C, intersection_update narrows the set in place
+            all_data_columns.update(task_data_keys)
             if not common_data_columns:
                 common_data_columns = set(task_data_keys)
             else:
-                common_data_columns &= set(task_data_keys)
+                common_data_columns.intersection_update(task_data_keys)
 
-        self.all_data_columns = all_data_columns
+        self.all_data_columns = dict(all_data_columns)
         if not self.common_data_columns:
             self.common_data_columns = list(sorted(common_data_columns))
         else:
@@ -1,6 +1,9 @@
 from annoying.fields import AutoOneToOneField
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from organizations.models import Organization
 
@@ -28,3 +31,11 @@ class SessionTimeoutPolicy(models.Model):
 
     created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
+
+
+@receiver(post_save, sender=SessionTimeoutPolicy)
+def bump_session_policy_version(sender, instance, **kwargs):
+    """Invalidate the copies of this policy that the session middleware keeps in user sessions"""
+    Organization.objects.filter(pk=instance.organization_id).update(
+        session_policy_version=F('session_policy_version') + 1
+    )
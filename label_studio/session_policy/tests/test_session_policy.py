@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from organizations.tests.factories import OrganizationFactory
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -73,3 +75,33 @@ def test_session_policy_api(fflag_feat_utc_46_session_timeout_policy_on):
     data = response.json()
     assert data['max_session_age'] == new_policy['max_session_age']
     assert data['max_time_between_activity'] == new_policy['max_time_between_activity']
+
+
+@pytest.mark.django_db
+def test_session_timeout_policy_cached_in_session(fflag_feat_utc_46_session_timeout_policy_on):
+    organization = OrganizationFactory()
+
+    client = APIClient()
+    user = organization.created_by
+    user.set_password('testpass123')
+    user.save()
+    client.post('/user/login/', {'email': user.email, 'password': 'testpass123'})
+
+    # the first requests create the policy and cache it in the session
+    assert client.get('/api/projects/').status_code == status.HTTP_200_OK
+    assert client.get('/api/projects/').status_code == status.HTTP_200_OK
+
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get('/api/projects/').status_code == status.HTTP_200_OK
+    policy_table = SessionTimeoutPolicy._meta.db_table
+    assert not [q for q in queries.captured_queries if policy_table in q['sql']]
+
+    # updating the policy bumps the organization version and invalidates the cached copy
+    timeout_policy = SessionTimeoutPolicy.objects.get(organization=organization)
+    timeout_policy.max_session_age = 0
+    timeout_policy.save()
+    organization.refresh_from_db()
+    assert organization.session_policy_version > 0
+
+    response = client.get('/api/projects/')
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -394,7 +394,9 @@ class BaseTaskSerializerBulk(serializers.ListSerializer):
             self.add_predictions(task_predictions)
 
         self.post_process_annotations(user, db_annotations, 'imported')
-        self.post_process_tasks(self.project.id, [t.id for t in self.db_tasks])
+        # collected once, import callers reuse them instead of walking the task objects again
+        self.db_task_ids = [t.id for t in self.db_tasks]
+        self.post_process_tasks(self.project.id, self.db_task_ids)
         self.post_process_custom_callback(self.project.id, user)
 
         if flag_set('fflag_feat_back_lsdv_5307_import_reviews_drafts_29062023_short', user=ff_user):
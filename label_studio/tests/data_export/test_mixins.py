@@ -0,0 +1,181 @@
+import csv
+import hashlib
+import io
+import json
+import zipfile
+
+import numpy as np
+import pytest
+from data_export import mixins
+from data_export.mixins import iter_export_json
+from data_export.models import Export
+from PIL import Image
+from projects.tests.factories import ProjectFactory
+from tasks.tests.factories import AnnotationFactory, TaskFactory
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_iter_export_json(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(mixins, 'orjson', None)
+    items = [{'id': 1, 'data': {'text': 'Привет'}}, {'id': 2, 'data': {'n': 2**70}}]
+
+    payload = b''.join(iter_export_json(iter(items)))
+
+    assert json.loads(payload.decode('utf-8')) == items
+    assert 'Привет'.encode('utf-8') in payload
+
+
+def test_iter_export_json_empty():
+    assert b''.join(iter_export_json(iter([]))) == b'[]'
+
+
+@pytest.mark.django_db
+def test_get_export_data_streams_all_tasks():
+    project = ProjectFactory()
+    tasks = TaskFactory.create_batch(3, project=project)
+    export = Export.objects.create(project=project, created_by=project.created_by)
+
+    exported = list(export.get_export_data())
+
+    assert sorted(task['id'] for task in exported) == sorted(task.id for task in tasks)
+    assert export.counters['task_number'] == 3
+
+
+@pytest.mark.django_db
+def test_get_export_data_only_with_annotations():
+    project = ProjectFactory()
+    annotated, skipped, _ = TaskFactory.create_batch(3, project=project)
+    AnnotationFactory(task=annotated, project=project)
+    AnnotationFactory(task=skipped, project=project, was_cancelled=True)
+    export = Export.objects.create(project=project, created_by=project.created_by)
+
+    exported = list(
+        export.get_export_data(
+            task_filter_options={'only_with_annotations': True},
+            annotation_filter_options={'usual': True},
+        )
+    )
+
+    # the skipped task's only annotation is filtered out of the export, so the task is dropped too
+    assert [task['id'] for task in exported] == [annotated.id]
+    assert len(exported[0]['annotations']) == 1
+    assert export.counters['task_number'] == 1
+
+
+@pytest.mark.django_db
+def test_convert_file_returns_readable_file():
+    project = ProjectFactory(
+        label_config='<View><Text name="text" value="$text"/><Choices name="label" toName="text">'
+        '<Choice value="pos"/><Choice value="neg"/></Choices></View>'
+    )
+    task = TaskFactory(project=project, data={'text': 'hello'})
+    AnnotationFactory(
+        task=task,
+        project=project,
+        result=[
+            {'from_name': 'label', 'to_name': 'text', 'type': 'choices', 'value': {'choices': ['pos']}, 'id': 'r1'}
+        ],
+    )
+    export = Export.objects.create(project=project, created_by=project.created_by)
+    export.export_to_file()
+
+    converted = export.convert_file('JSON_MIN')
+
+    assert converted.name.endswith('.json')
+    [item] = json.loads(converted.read())
+    assert item['text'] == 'hello'
+    assert item['label'] == 'pos'
+    converted.close()
+
+
+@pytest.mark.django_db
+def test_convert_file_to_segmentation_csv():
+    project = ProjectFactory(
+        label_config='<View><Image name="image" value="$image"/>'
+        '<BrushLabels name="label" toName="image"><Label value="Cell"/></BrushLabels></View>'
+    )
+    TaskFactory(project=project, data={'image': 'missing.png'})
+    export = Export.objects.create(project=project, created_by=project.created_by)
+    export.export_to_file()
+
+    converted = export.convert_file('SEG_CSV')
+
+    assert converted.name == f'project-{project.id}-segmentation.csv.zip'
+    with zipfile.ZipFile(converted) as zf:
+        assert zf.namelist() == ['README.txt']
+    converted.close()
+
+
+@pytest.mark.django_db
+def test_convert_file_to_segmentation_csv_with_regions(tmp_path):
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[1:3, 1:3] = (30, 60, 90)
+    image_path = tmp_path / 'cells.png'
+    Image.fromarray(rgb).save(image_path)
+    project = ProjectFactory(
+        label_config='<View><Image name="image" value="$image"/>'
+        '<BrushLabels name="label" toName="image"><Label value="Cell"/></BrushLabels></View>'
+    )
+    task = TaskFactory(project=project, data={'image': str(image_path)})
+    AnnotationFactory(
+        task=task,
+        project=project,
+        result=[
+            {
+                'id': 'brush',
+                'from_name': 'label',
+                'to_name': 'image',
+                'type': 'brushlabels',
+                'original_width': 4,
+                'original_height': 4,
+                'value': {'format': 'rle', 'rle': [5, 2, 2, 2], 'brushlabels': ['Cell']},
+            }
+        ],
+    )
+    export = Export.objects.create(project=project, created_by=project.created_by)
+    export.export_to_file()
+
+    converted = export.convert_file('seg_csv')
+
+    member = f'cells.png__task_{task.id}.csv'
+    with zipfile.ZipFile(converted) as zf:
+        assert zf.namelist() == [member]
+        rows = list(csv.DictReader(io.TextIOWrapper(zf.open(member), encoding='utf-8')))
+    converted.close()
+    assert [(row['region_id'], row['label'], row['area_px']) for row in rows] == [('brush', 'Cell', '4')]
+    assert float(rows[0]['mean_r']) == 30.0
+
+
+@pytest.mark.django_db
+def test_export_to_file_moves_snapshot_into_storage(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    project = ProjectFactory()
+    TaskFactory.create_batch(2, project=project)
+    export = Export.objects.create(project=project, created_by=project.created_by)
+
+    export.export_to_file()
+
+    export.refresh_from_db()
+    assert export.status == Export.Status.COMPLETED
+    with export.file.open('rb') as f:
+        content = f.read()
+    assert len(json.loads(content)) == 2
+    assert export.md5 == hashlib.md5(content).hexdigest()
+
+
+@pytest.mark.django_db
+def test_only_with_annotations_subquery_is_scoped_to_tasks():
+    project = ProjectFactory()
+    other_project = ProjectFactory()
+    task = TaskFactory(project=project)
+    AnnotationFactory(task=TaskFactory(project=other_project), project=other_project)
+    export = Export.objects.create(project=project, created_by=project.created_by)
+
+    tasks = export._get_filtered_tasks(project.tasks, task_filter_options={'only_with_annotations': True})
+
+    # the other project's annotation doesn't count, and the subquery is correlated to the task
+    assert task.id not in tasks.values_list('id', flat=True)
+    assert 'EXISTS' in str(tasks.query)
@@ -0,0 +1,221 @@
+import csv
+import io
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import requests_mock
+from data_export.formats.segmentation_csv_exporter import (
+    _compute_bbox_and_area,
+    _compute_intensities,
+    _decode_brush_rle_to_mask,
+    _decode_image,
+    _map_bounded,
+    _rasterize_polygon,
+    export_segmentation_metrics,
+)
+from PIL import Image, ImageDraw
+
+
+@pytest.mark.parametrize(
+    'rle, width, height, expected',
+    [
+        ([1, 1, 2, 2, 3], 9, 1, [0, 1, 0, 0, 1, 1, 0, 0, 0]),
+        ([2, 3], 3, 2, [0, 0, 1, 1, 1, 0]),
+        # zero-length runs flip the value without advancing
+        ([0, 2, 0, 3, 1], 3, 2, [1, 1, 1, 1, 1, 0]),
+        # runs past the end of the canvas are clipped
+        ([1, 100, 4], 2, 2, [0, 1, 1, 1]),
+        ([], 2, 2, [0, 0, 0, 0]),
+    ],
+)
+def test_decode_brush_rle_to_mask(rle, width, height, expected):
+    mask = _decode_brush_rle_to_mask(rle, width, height)
+    assert mask.dtype == bool
+    assert mask.shape == (height, width)
+    assert mask.ravel().tolist() == [bool(v) for v in expected]
+
+
+def test_decode_brush_rle_to_mask_accepts_ndarray():
+    mask = _decode_brush_rle_to_mask(np.array([1, 2, 1]), 2, 2)
+    assert mask.ravel().tolist() == [False, True, True, False]
+
+
+def test_compute_bbox_and_area():
+    mask = np.zeros((5, 6), dtype=bool)
+    mask[1, 2] = mask[3, 4] = mask[2, 3] = True
+
+    assert _compute_bbox_and_area(mask) == (2, 1, 2, 2, 3)
+    assert _compute_bbox_and_area(np.zeros((5, 6), dtype=bool)) == (0, 0, 0, 0, 0)
+
+
+def test_rasterize_polygon_is_cropped_to_bbox():
+    points = [(2, 1), (5, 1), (5, 3), (2, 3)]
+    x0, y0, mask = _rasterize_polygon(points, 10, 8)
+
+    full = Image.new('L', (10, 8), 0)
+    ImageDraw.Draw(full).polygon(points, outline=1, fill=1)
+    expected = np.asarray(full) > 0
+
+    assert (x0, y0, mask.shape) == (2, 1, (3, 4))
+    assert (expected[y0 : y0 + 3, x0 : x0 + 4] == mask).all()
+    assert mask.sum() == expected.sum()
+
+
+def test_compute_intensities_rgb():
+    rgb = np.zeros((2, 3, 3), dtype=np.uint8)
+    rgb[0, 0] = (10, 20, 30)
+    rgb[1, 2] = (30, 60, 90)
+    mask = np.zeros((2, 3), dtype=bool)
+    mask[0, 0] = mask[1, 2] = True
+
+    mean_gray, mean_r, mean_g, mean_b = _compute_intensities(_decode_image(Image.fromarray(rgb)), mask, 2)
+
+    assert (mean_r, mean_g, mean_b) == (20.0, 40.0, 60.0)
+    assert mean_gray == pytest.approx(0.299 * 20 + 0.587 * 40 + 0.114 * 60, abs=1)
+
+
+def test_compute_intensities_gray_and_empty_mask():
+    gray = _decode_image(Image.fromarray(np.full((2, 2), 100, dtype=np.uint8)))
+    mask = np.array([[True, False], [False, False]])
+
+    assert _compute_intensities(gray, mask, 1) == (100.0, None, None, None)
+    assert _compute_intensities(gray, np.zeros((2, 2), dtype=bool), 0) == (None, None, None, None)
+
+
+def test_export_segmentation_metrics(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[1:3, 1:3] = (30, 60, 90)
+    image_path = tmp_path / 'cells.png'
+    Image.fromarray(rgb).save(image_path)
+
+    project = SimpleNamespace(
+        id=1,
+        get_parsed_config=lambda: {
+            'label': {'type': 'PolygonLabels', 'inputs': [{'type': 'Image', 'name': 'image', 'value': '$image'}]}
+        },
+        resolve_storage_uri=lambda url: None,
+    )
+    tasks = [
+        {
+            'id': 7,
+            'data': {'image': str(image_path)},
+            'annotations': [
+                {
+                    'id': 11,
+                    'result': [
+                        {
+                            'id': 'brush',
+                            'type': 'brushlabels',
+                            'to_name': 'image',
+                            'original_width': 4,
+                            'original_height': 4,
+                            'value': {'format': 'rle', 'rle': [5, 2, 2, 2], 'brushlabels': ['Cell']},
+                        },
+                        {
+                            'id': 'poly',
+                            'type': 'polygonlabels',
+                            'to_name': 'image',
+                            'original_width': 4,
+                            'original_height': 4,
+                            'value': {'points': [[0, 0], [50, 0], [50, 50], [0, 50]], 'polygonlabels': ['Nucleus']},
+                        },
+                    ],
+                }
+            ],
+        }
+    ]
+
+    out, content_type, filename = export_segmentation_metrics(tasks, project, download_resources=False)
+
+    assert content_type == 'application/zip'
+    assert filename == 'project-1-segmentation.csv.zip'
+    with zipfile.ZipFile(out) as zf:
+        assert zf.namelist() == ['cells.png__task_7.csv']
+        rows = list(csv.DictReader(io.TextIOWrapper(zf.open('cells.png__task_7.csv'), encoding='utf-8')))
+    out.close()
+
+    brush, poly = rows
+    assert (brush['region_id'], brush['label'], brush['shape_type']) == ('brush', 'Cell', 'mask')
+    assert (brush['bbox_x_px'], brush['bbox_y_px'], brush['x_length_px'], brush['y_length_px']) == ('1', '1', '1', '1')
+    assert brush['area_px'] == '4'
+    assert (float(brush['mean_r']), float(brush['mean_g']), float(brush['mean_b'])) == (30.0, 60.0, 90.0)
+    assert brush['polygon_points_px'] == ''
+
+    assert (poly['region_id'], poly['label'], poly['shape_type']) == ('poly', 'Nucleus', 'polygon')
+    assert (poly['bbox_x_px'], poly['bbox_y_px'], poly['area_px']) == ('0', '0', '9')
+    assert float(poly['mean_r']) == pytest.approx(30 * 4 / 9)
+    assert json.loads(poly['polygon_points_px']) == [[0, 0], [2, 0], [2, 2], [0, 2]]
+
+
+def test_map_bounded_keeps_order_and_limits_prefetch():
+    consumed = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = _map_bounded(executor, lambda i: i * i, items(), window=3)
+        assert next(results) == 0
+        assert len(consumed) == 3
+        assert list(results) == [i * i for i in range(1, 10)]
+
+
+def test_export_segmentation_metrics_without_rows(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    project = SimpleNamespace(id=2, get_parsed_config=lambda: {}, resolve_storage_uri=lambda url: None)
+
+    out, _, _ = export_segmentation_metrics([{'id': 1, 'data': {}, 'annotations': []}], project, False)
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.namelist() == ['README.txt']
+    out.close()
+
+
+def test_export_segmentation_metrics_downloads_each_image_once(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    buffer = io.BytesIO()
+    Image.fromarray(np.full((4, 4, 3), 50, dtype=np.uint8)).save(buffer, format='PNG')
+    owner = SimpleNamespace(auth_token=SimpleNamespace(key='secret'))
+    project = SimpleNamespace(
+        id=3,
+        get_parsed_config=lambda: {},
+        resolve_storage_uri=lambda url: None,
+        organization=SimpleNamespace(created_by=owner),
+    )
+    regions = [
+        {'id': f'r{i}', 'type': 'brushlabels', 'value': {'format': 'rle', 'rle': [i, 2], 'brushlabels': ['Cell']}}
+        for i in range(3)
+    ]
+    tasks = [{'id': 1, 'data': {'image': 'http://example.com/cells.png'}, 'annotations': [{'id': 1, 'result': regions}]}]
+
+    with requests_mock.Mocker() as m:
+        m.get('http://example.com/cells.png', content=buffer.getvalue())
+        out, _, _ = export_segmentation_metrics(tasks, project, download_resources=True)
+
+    assert m.call_count == 1
+    assert m.last_request.headers['Authorization'] == 'Token secret'
+    with zipfile.ZipFile(out) as zf:
+        rows = list(csv.DictReader(io.TextIOWrapper(zf.open('cells.png__task_1.csv'), encoding='utf-8')))
+    out.close()
+    assert [row['region_id'] for row in rows] == ['r0', 'r1', 'r2']
+    assert all(float(row['mean_r']) == 50.0 for row in rows)
+
+
+def test_decode_image_jpeg_draft():
+    buffer = io.BytesIO()
+    Image.fromarray(np.full((64, 48, 3), 120, dtype=np.uint8)).save(buffer, format='JPEG')
+    mask = np.ones((10, 10), dtype=bool)
+
+    decoded = _decode_image(Image.open(buffer), draft=True)
+
+    assert (decoded.width, decoded.height, decoded.scale) == (48, 64, 2)
+    assert decoded.rgb.shape == (32, 24, 3)
+    mean_gray, mean_r, mean_g, mean_b = _compute_intensities(decoded, mask, 100, 30, 50)
+    assert mean_r == pytest.approx(120, abs=2)
@@ -0,0 +1,31 @@
+import pytest
+from data_import.functions import _start_processing, reformat_predictions
+from projects.models import ProjectImport
+from projects.tests.factories import ProjectFactory
+
+
+def test_reformat_predictions():
+    tasks = [
+        {'text': 'a', 'pred': [{'id': 1}]},
+        {'data': {'text': 'b', 'pred': [{'id': 2}]}},
+    ]
+
+    result = reformat_predictions(tasks, ['pred'])
+
+    assert result == [
+        {'data': {'text': 'a'}, 'predictions': [{'result': [{'id': 1}]}]},
+        {'data': {'text': 'b'}, 'predictions': [{'result': [{'id': 2}]}]},
+    ]
+    assert result is tasks
+
+
+@pytest.mark.django_db
+def test_start_processing_runs_once():
+    project_import = ProjectImport.objects.create(project=ProjectFactory())
+
+    assert _start_processing(ProjectImport, project_import.id)
+    assert not _start_processing(ProjectImport, project_import.id)
+    assert not _start_processing(ProjectImport, project_import.id + 1)
+
+    project_import.refresh_from_db()
+    assert project_import.status == ProjectImport.Status.IN_PROGRESS
@@ -1,12 +1,14 @@
 """This file and its contents are licensed under the Apache License 2.0. Please see the included NOTICE for copyright information and LICENSE for a copy of the license.
 """
+import os
 import types
 
 import pytest
-from core.utils.common import int_from_request
+from core.utils.common import ProcessSession, int_from_request, temporary_disconnect_all_signals
 from core.utils.exceptions import InvalidUploadUrlError, LabelStudioAPIException
 from core.utils.io import validate_upload_url
 from core.utils.params import bool_from_request
+from django.db.models.signals import post_delete
 from rest_framework.exceptions import ValidationError
 
 
@@ -185,3 +187,41 @@ def test_core_validate_upload_url(url, block_local_urls, raises_exc):
 
     with pytest.raises(raises_exc):
         validate_upload_url(url, block_local_urls=block_local_urls)
+
+
+def test_temporary_disconnect_all_signals_ignores_cached_receivers():
+    class Sender:
+        pass
+
+    calls = []
+
+    def receiver(sender, **kwargs):
+        calls.append(sender)
+
+    post_delete.connect(receiver, sender=Sender, weak=False)
+    try:
+        # warm the per-sender receivers cache
+        post_delete.send(sender=Sender)
+        assert calls == [Sender]
+
+        with temporary_disconnect_all_signals():
+            assert not post_delete.has_listeners(Sender)
+            post_delete.send(sender=Sender)
+        assert calls == [Sender]
+
+        post_delete.send(sender=Sender)
+        assert calls == [Sender, Sender]
+    finally:
+        post_delete.disconnect(receiver, sender=Sender)
+
+
+def test_process_session_is_shared_per_process(monkeypatch):
+    http = ProcessSession(schemes=('https://',), pool_maxsize=4)
+
+    session = http.get()
+    assert http.get() is session
+    assert session.get_adapter('https://example.com')._pool_maxsize == 4
+
+    # a forked worker gets its own session
+    monkeypatch.setattr(os, 'getpid', lambda: -1)
+    assert http.get() is not session
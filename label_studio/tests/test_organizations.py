@@ -1,10 +1,13 @@
 """This file and its contents are licensed under the Apache License 2.0. Please see the included NOTICE for copyright information and LICENSE for a copy of the license.
 """
 import pytest
+from organizations.middleware import DummyGetSessionMiddleware
 from organizations.models import Organization, OrganizationMember
+from organizations.tests.factories import OrganizationFactory
 from tasks.models import Task
 from tests.utils import make_annotation
 from users.models import User
+from users.tests.factories import UserFactory
 
 
 @pytest.mark.django_db
@@ -58,3 +61,34 @@ def test_organization_member_retrieve_not_active_org(business_client):
     OrganizationMember.objects.create(user=user, organization=other_organization)
     response = business_client.get(f'/api/organizations/{other_organization.id}/memberships/{user.id}/')
     assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_legacy_user_gets_own_organization(client):
+    user = User.objects.create(email='legacy@pytest.net')
+    client.force_login(user)
+
+    client.get('/api/projects/')
+
+    user.refresh_from_db()
+    assert user.active_organization is not None
+    assert user.active_organization.created_by == user
+    assert OrganizationMember.objects.filter(user=user, organization=user.active_organization).exists()
+
+
+@pytest.mark.django_db
+def test_legacy_user_keeps_concurrently_assigned_organization(rf):
+    winner = OrganizationFactory()
+    user = UserFactory(active_organization=winner)
+    # stale instance: another request assigned the organization after this one loaded the user
+    request = rf.get('/')
+    request.user = User.objects.get(pk=user.pk)
+    request.user.active_organization_id = None
+    request.session = {}
+
+    DummyGetSessionMiddleware(lambda request: None)(request)
+
+    assert request.user.active_organization_id == winner.id
+    assert request.session['organization_pk'] == winner.id
+    user.refresh_from_db()
+    assert user.active_organization_id == winner.id
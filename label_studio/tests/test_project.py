@@ -40,3 +40,16 @@ def test_project_all_members(business_client):
 
     assert isinstance(members, QuerySet)
     assert isinstance(members.first(), User)
+
+
+@pytest.mark.django_db
+def test_summary_update_data_columns(business_client):
+    project = make_project({}, business_client.user, use_ml_backend=False)
+    s = project.summary
+
+    s.update_data_columns([{'data': {'image': 'a.jpg', 'meta': 1}}, {'image': 'b.jpg'}])
+    s.update_data_columns([{'data': {'image': 'c.jpg', 'extra': 2}}])
+
+    s.refresh_from_db()
+    assert s.all_data_columns == {'image': 3, 'meta': 1, 'extra': 1}
+    assert s.common_data_columns == ['image']
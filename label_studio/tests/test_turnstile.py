@@ -0,0 +1,33 @@
+from turnstile.utils import VERIFY_URL, _get_secret, _http, is_enabled, verify_turnstile
+
+
+def test_is_enabled_follows_setting_overrides(settings):
+    settings.TURNSTILE_ENABLED = True
+    assert is_enabled()
+
+    settings.TURNSTILE_ENABLED = False
+    assert not is_enabled()
+    assert verify_turnstile('token') == (True, {'skipped': True})
+
+
+def test_get_secret_follows_setting_overrides(settings):
+    settings.TURNSTILE_SECRET_KEY = 'first'
+    assert _get_secret() == 'first'
+
+    settings.TURNSTILE_SECRET_KEY = 'second'
+    assert _get_secret() == 'second'
+
+
+def test_verify_turnstile_reuses_session(settings, requests_mock):
+    settings.TURNSTILE_ENABLED = True
+    settings.TURNSTILE_SECRET_KEY = 'secret'
+    requests_mock.post(VERIFY_URL, json={'success': True}, headers={'content-type': 'application/json'})
+
+    assert verify_turnstile('token-1', ip='10.0.0.1') == (True, {'success': True})
+    session = _http.get()
+    assert verify_turnstile('token-2')[0]
+    assert _http.get() is session
+
+    first, second = requests_mock.request_history
+    assert 'response=token-1' in first.text and 'remoteip=10.0.0.1' in first.text
+    assert 'remoteip' not in second.text
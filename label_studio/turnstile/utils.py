@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
-import requests
+from core.utils.common import ProcessSession
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from urllib3.util.retry import Retry
 
 VERIFY_URL = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
 DEFAULT_TIMEOUT_SECS = 5
+POOL_MAXSIZE = 32
+
+# Keep-alive session per process, so verifications reuse the TLS connection to Cloudflare
+# instead of handshaking every time. urllib3 never retries a POST after it was sent (tokens
+# are single-use), only failed connects.
+_http = ProcessSession(
+    schemes=("https://",), pool_maxsize=POOL_MAXSIZE, max_retries=Retry(total=1, backoff_factor=0.1)
+)
 
 
 def _bool_env(value: Optional[str], default: bool = False) -> bool:
@@ -18,6 +30,9 @@ def _bool_env(value: Optional[str], default: bool = False) -> bool:
     return value.lower() in ("1", "true", "yes", "on")
 
 
+# Both are read on every POST of protected views; settings and env don't change at runtime,
+# so resolve them once (see _clear_cached_settings for overrides in tests).
+@lru_cache(maxsize=1)
 def is_enabled() -> bool:
     """Return whether Turnstile verification is enabled via settings or env."""
     enabled = getattr(settings, "TURNSTILE_ENABLED", None)
@@ -26,12 +41,20 @@ def is_enabled() -> bool:
     return bool(enabled)
 
 
+@lru_cache(maxsize=1)
 def _get_secret() -> str:
     """Get the Turnstile secret key from settings or env."""
     secret = getattr(settings, "TURNSTILE_SECRET_KEY", "") or os.getenv("TURNSTILE_SECRET_KEY", "")
     return secret or ""
 
 
+@receiver(setting_changed)
+def _clear_cached_settings(setting, **kwargs):
+    if setting in ("TURNSTILE_ENABLED", "TURNSTILE_SECRET_KEY"):
+        is_enabled.cache_clear()
+        _get_secret.cache_clear()
+
+
 def verify_turnstile(token: str, ip: Optional[str] = None) -> Tuple[bool, Dict[str, Any]]:
     """
     Verify a Turnstile token with Cloudflare.
@@ -60,7 +83,7 @@ def verify_turnstile(token: str, ip: Optional[str] = None) -> Tuple[bool, Dict[s
         data["remoteip"] = ip
 
     try:
-        resp = requests.post(VERIFY_URL, data=data, timeout=DEFAULT_TIMEOUT_SECS)
+        resp = _http.get().post(VERIFY_URL, data=data, timeout=DEFAULT_TIMEOUT_SECS)
         info = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {"status_code": resp.status_code, "text": resp.text}
         return bool(info.get("success")), info
     except Exception as exc: